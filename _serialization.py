@@ -0,0 +1,65 @@
+"""
+Serialization helpers for fast JSON encoding/decoding.
+Uses orjson when available (Rust-accelerated, ~3x faster loads, ~10x faster
+dumps than stdlib json) and falls back to the standard library otherwise.
+"""
+
+import threading
+
+try:
+    import orjson
+
+    def loads(data):
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return orjson.dumps(obj)
+
+    def pretty(obj) -> str:
+        """Serialize an object to indented JSON for debug output."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+    def pretty(obj) -> str:
+        """Serialize an object to indented JSON for debug output."""
+        return json.dumps(obj, indent=2)
+
+
+try:
+    import simdjson
+
+    # simdjson.Parser reuses its internal tape buffer across parse() calls,
+    # but is not thread-safe, so keep one per worker thread
+    _local = threading.local()
+
+    def parse(data):
+        """
+        Parse JSON with a reusable SIMD-accelerated parser.
+
+        Best for repeated parsing of large response bodies; results are
+        materialized so they stay valid after the parser's buffer is reused.
+        """
+        parser = getattr(_local, 'parser', None)
+        if parser is None:
+            parser = _local.parser = simdjson.Parser()
+        doc = parser.parse(data)
+        if isinstance(doc, simdjson.Object):
+            return doc.as_dict()
+        if isinstance(doc, simdjson.Array):
+            return doc.as_list()
+        return doc
+
+except ImportError:
+    parse = loads
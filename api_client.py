@@ -3,27 +3,209 @@ API Client module for interacting with the mock Avi Load Balancer API.
 Handles authentication, API calls, and response parsing.
 """
 
+import io
+import time
+import types
+import base64
+import logging
+import threading
 import requests
-import json
-from typing import Dict, Any, Optional, List
-from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from _serialization import loads, dumps, parse
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Only advertise brotli when the decoder is actually installed; urllib3
+# can't decompress a br response without it
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+log = logging.getLogger(__name__)
+
+
+def _preview(response) -> str:
+    """First 512 bytes of a response body, for error logs.
+
+    Avoids the full-body str decode that response.text forces, which can
+    be megabytes for a proxy's HTML error page.
+    """
+    return response.content[:512].decode('utf-8', errors='replace')
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker for a single host.
+
+    Opens after `threshold` consecutive transport failures; while open,
+    calls fast-fail instead of each paying the full request timeout. After
+    `cooldown` seconds the breaker half-opens and lets one probe through;
+    a success closes it again.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed."""
+        with self._lock:
+            if self._failures < self.threshold:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown:
+                # Half-open: let a single probe through
+                self._failures = self.threshold - 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Reset the failure count after a successful call."""
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a transport failure, opening the breaker at the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._opened_at = time.monotonic()
+
+
+if httpx is not None:
+    class _RetryTransport(httpx.HTTPTransport):
+        """
+        HTTPTransport that also retries retryable status codes.
+
+        httpx's built-in retries only cover connect errors, so this
+        mirrors the urllib3 Retry policy mounted on the requests
+        fallback (3 retries on 429/502/503/504 with exponential
+        backoff) — switching backends must not drop that behavior.
+        """
+
+        _STATUS_FORCELIST = frozenset({429, 502, 503, 504})
+
+        def __init__(self, *args, status_retries: int = 3,
+                     backoff_factor: float = 0.2, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._status_retries = status_retries
+            self._backoff_factor = backoff_factor
+
+        def handle_request(self, request):
+            response = None
+            for attempt in range(self._status_retries + 1):
+                if attempt:
+                    time.sleep(self._backoff_factor * (2 ** (attempt - 1)))
+                response = super().handle_request(request)
+                if (response.status_code not in self._STATUS_FORCELIST
+                        or attempt == self._status_retries):
+                    break
+                response.close()
+            return response
 
 
 class APIClient:
     """Client for interacting with the mock Avi Load Balancer API."""
-    
-    def __init__(self, base_url: str, timeout: int = 30):
+
+    def __init__(self, base_url: str, timeout: int = 30, pool_size: int = 10):
         """
         Initialize API Client.
-        
+
         Args:
             base_url: Base URL of the API (e.g., https://semantic-brandea-banao-dc049ed0.koyeb.app/)
             timeout: Request timeout in seconds
+            pool_size: Number of connections to keep in the pool (size this to
+                the number of parallel workers so keep-alive actually applies)
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.token = None
-        self.session = requests.Session()
+
+        # Endpoint URLs built once instead of re-interpolated per call
+        self.urls = types.SimpleNamespace(
+            register=f"{self.base_url}/register",
+            login=f"{self.base_url}/login",
+            tenant=f"{self.base_url}/api/tenant",
+            virtualservice=f"{self.base_url}/api/virtualservice",
+            serviceengine=f"{self.base_url}/api/serviceengine"
+        )
+
+        # Prefer an HTTP/2 client when httpx (with the h2 extra) is
+        # installed: concurrent calls then multiplex streams over one
+        # TLS connection instead of opening one connection per worker
+        self.http2 = False
+        if httpx is not None:
+            try:
+                self.session = httpx.Client(
+                    timeout=timeout,
+                    transport=_RetryTransport(
+                        http2=True,
+                        retries=3,
+                        limits=httpx.Limits(max_keepalive_connections=pool_size,
+                                            max_connections=pool_size * 2))
+                )
+                self.http2 = True
+            except ImportError:
+                pass  # httpx present but h2 extra missing
+
+        if not self.http2:
+            self.session = requests.Session()
+
+            # Sized connection pool with retries so parallel workers reuse
+            # keep-alive connections instead of renegotiating TLS per call
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size * 2,
+                max_retries=Retry(total=3, backoff_factor=0.2,
+                                  status_forcelist=[429, 502, 503, 504],
+                                  allowed_methods={"GET", "PUT", "POST"})
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+        # Set once on the session so per-call headers only need Authorization.
+        # Explicit Accept-Encoding lets the server compress the multi-MB list
+        # responses; decompressed bytes go straight to the JSON parser.
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Accept-Encoding": _ACCEPT_ENCODING
+        })
+
+        # TTL cache of the virtual-service list with O(1) name/uuid lookup
+        # indexes, shared safely across worker threads
+        self._vs_cache_lock = threading.Lock()
+        self._vs_cache_ts = 0.0
+        self._vs_cache_ttl = 30
+        self._vs_name_index = {}
+        self._vs_uuid_index = {}
+        self._basic_auth_header = None
+
+        # True after a login rejected with 401/403, i.e. the account likely
+        # needs to be registered first (as opposed to a network error)
+        self.needs_registration = False
+
+        # Fast-fail when the host is known down instead of letting every
+        # parallel worker burn the full timeout independently
+        self._breaker = CircuitBreaker()
     
     def register(self, username: str, password: str) -> bool:
         """
@@ -37,24 +219,24 @@ class APIClient:
             True if registration successful, False otherwise
         """
         try:
-            url = f"{self.base_url}/register"
+            url = self.urls.register
             payload = {
                 "username": username,
                 "password": password
             }
-            response = self.session.post(url, json=payload, timeout=self.timeout)
+            response = self._request('post', url, timeout=self.timeout, **self._body(payload))
             
             if response.status_code == 200:
-                print(f"[API_CLIENT] User '{username}' registered successfully")
+                log.info("User '%s' registered successfully", username)
                 return True
             elif response.status_code == 409:
-                print(f"[API_CLIENT] User '{username}' already exists")
+                log.info("User '%s' already exists", username)
                 return True  # Consider existing user as acceptable
             else:
-                print(f"[API_CLIENT] Registration failed: {response.status_code} - {response.text}")
+                log.warning("Registration failed: %s - %s", response.status_code, _preview(response))
                 return False
         except Exception as e:
-            print(f"[API_CLIENT] Registration error: {e}")
+            log.error("Registration error: %s", e)
             return False
     
     def login(self, username: str, password: str) -> bool:
@@ -69,29 +251,57 @@ class APIClient:
             True if login successful, False otherwise
         """
         try:
-            url = f"{self.base_url}/login"
-            auth = HTTPBasicAuth(username, password)
-            response = self.session.post(url, auth=auth, timeout=self.timeout)
+            url = self.urls.login
+            # Precompute the Basic header once instead of letting an auth
+            # object re-encode credentials in the prepare-request hook;
+            # kept on self for future re-login/refresh flows
+            self._basic_auth_header = "Basic " + base64.b64encode(
+                f"{username}:{password}".encode()).decode()
+            response = self._request('post', url,
+                                     headers={"Authorization": self._basic_auth_header},
+                                     timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = loads(response.content)
                 self.token = data.get('token')
-                print(f"[API_CLIENT] Login successful. Token: {self.token[:20]}...")
+                # Set once on the session; every subsequent call inherits it
+                # without building a per-call headers dict
+                self.session.headers["Authorization"] = f"Bearer {self.token}"
+                self.needs_registration = False
+                log.info("Login successful. Token: %s...", self.token[:20])
                 return True
             else:
-                print(f"[API_CLIENT] Login failed: {response.status_code} - {response.text}")
+                self.needs_registration = response.status_code in (401, 403)
+                log.warning("Login failed: %s - %s", response.status_code, _preview(response))
                 return False
         except Exception as e:
-            print(f"[API_CLIENT] Login error: {e}")
+            log.error("Login error: %s", e)
             return False
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get authorization headers with bearer token."""
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-    
+    def _body(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the request-body kwargs for the active HTTP backend."""
+        encoded = dumps(payload)
+        if self.http2:
+            return {'content': encoded}
+        return {'data': encoded}
+
+    def _request(self, method: str, url: str, **kwargs):
+        """
+        Issue an HTTP request through the circuit breaker.
+
+        Raises:
+            CircuitOpenError: When the breaker is open for this host
+        """
+        if not self._breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {self.base_url}; fast-failing")
+        try:
+            response = getattr(self.session, method)(url, **kwargs)
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return response
+
     def get_tenants(self) -> Optional[List[Dict[str, Any]]]:
         """
         Fetch all tenants from the API.
@@ -100,18 +310,18 @@ class APIClient:
             List of tenants or None if request fails
         """
         try:
-            url = f"{self.base_url}/api/tenant"
-            response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+            url = self.urls.tenant
+            response = self._request('get', url, timeout=self.timeout)
             
             if response.status_code == 200:
-                tenants = response.json()
-                print(f"[API_CLIENT] Fetched {len(tenants) if isinstance(tenants, list) else 1} tenant(s)")
+                tenants = parse(response.content)
+                log.info("Fetched %d tenant(s)", len(tenants) if isinstance(tenants, list) else 1)
                 return tenants if isinstance(tenants, list) else [tenants]
             else:
-                print(f"[API_CLIENT] Failed to fetch tenants: {response.status_code}")
+                log.warning("Failed to fetch tenants: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"[API_CLIENT] Error fetching tenants: {e}")
+            log.error("Error fetching tenants: %s", e)
             return None
     
     def get_virtual_services(self) -> Optional[List[Dict[str, Any]]]:
@@ -122,25 +332,57 @@ class APIClient:
             List of virtual services or None if request fails
         """
         try:
-            url = f"{self.base_url}/api/virtualservice"
-            response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+            url = self.urls.virtualservice
+            response = self._request('get', url, timeout=self.timeout)
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse(response.content)
                 # Handle paginated response
                 if isinstance(data, dict) and 'results' in data:
                     services = data.get('results', [])
                 else:
                     services = data if isinstance(data, list) else [data]
-                print(f"[API_CLIENT] Fetched {len(services)} virtual service(s)")
+                log.info("Fetched %d virtual service(s)", len(services))
                 return services
             else:
-                print(f"[API_CLIENT] Failed to fetch virtual services: {response.status_code}")
+                log.warning("Failed to fetch virtual services: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"[API_CLIENT] Error fetching virtual services: {e}")
+            log.error("Error fetching virtual services: %s", e)
             return None
     
+    def get_virtual_services_light(self) -> Optional[List[Tuple[str, str, bool]]]:
+        """
+        Fetch virtual services projected down to (name, uuid, enabled).
+
+        Decodes the list response once and keeps only the three fields
+        the test workflow reads, skipping the per-VS dict churn of the
+        full payload on large inventories.
+
+        Returns:
+            List of (name, uuid, enabled) tuples or None if request fails
+        """
+        try:
+            url = self.urls.virtualservice
+            response = self._request('get', url, timeout=self.timeout)
+
+            if response.status_code == 200:
+                data = parse(response.content)
+                # Handle paginated response
+                if isinstance(data, dict) and 'results' in data:
+                    services = data.get('results', [])
+                else:
+                    services = data if isinstance(data, list) else [data]
+                log.info("Fetched %d virtual service(s) (light)", len(services))
+                return [(v.get('name'), v.get('uuid'), v.get('enabled'))
+                        for v in services]
+            else:
+                log.warning("Failed to fetch virtual services: %s", response.status_code)
+                return None
+        except Exception as e:
+            log.error("Error fetching virtual services: %s", e)
+            return None
+
     def get_service_engines(self) -> Optional[List[Dict[str, Any]]]:
         """
         Fetch all service engines from the API.
@@ -149,21 +391,49 @@ class APIClient:
             List of service engines or None if request fails
         """
         try:
-            url = f"{self.base_url}/api/serviceengine"
-            response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+            url = self.urls.serviceengine
+            response = self._request('get', url, timeout=self.timeout)
             
             if response.status_code == 200:
-                engines = response.json()
+                engines = parse(response.content)
                 engines_list = engines if isinstance(engines, list) else [engines]
-                print(f"[API_CLIENT] Fetched {len(engines_list)} service engine(s)")
+                log.info("Fetched %d service engine(s)", len(engines_list))
                 return engines_list
             else:
-                print(f"[API_CLIENT] Failed to fetch service engines: {response.status_code}")
+                log.warning("Failed to fetch service engines: %s", response.status_code)
                 return None
         except Exception as e:
-            print(f"[API_CLIENT] Error fetching service engines: {e}")
+            log.error("Error fetching service engines: %s", e)
             return None
     
+    def fetch_inventory_concurrent(self, light_vs: bool = False) -> Dict[str, Optional[List[Any]]]:
+        """
+        Fetch tenants, virtual services, and service engines concurrently.
+
+        The three GETs are independent, so firing them together collapses
+        three serial round-trips into one wall-clock round-trip (Session is
+        thread-safe for reads).
+
+        Args:
+            light_vs: Fetch virtual services through the light projection
+                ((name, uuid, enabled) tuples) instead of full dicts
+
+        Returns:
+            Dictionary with 'tenants', 'virtual_services', and
+            'service_engines' keys
+        """
+        vs_fetch = self.get_virtual_services_light if light_vs else self.get_virtual_services
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            tenants_future = executor.submit(self.get_tenants)
+            services_future = executor.submit(vs_fetch)
+            engines_future = executor.submit(self.get_service_engines)
+
+            return {
+                'tenants': tenants_future.result(),
+                'virtual_services': services_future.result(),
+                'service_engines': engines_future.result()
+            }
+
     def get_virtual_service_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
         """
         Fetch a virtual service by UUID.
@@ -175,39 +445,117 @@ class APIClient:
             Virtual service data or None if not found
         """
         try:
-            url = f"{self.base_url}/api/virtualservice/{uuid}"
-            response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+            url = self.urls.virtualservice + '/' + uuid
+            response = self._request('get', url, timeout=self.timeout)
             
             if response.status_code == 200:
-                return response.json()
+                return parse(response.content)
             else:
-                print(f"[API_CLIENT] Failed to fetch virtual service {uuid}: {response.status_code}")
+                log.warning("Failed to fetch virtual service %s: %s", uuid, response.status_code)
                 return None
         except Exception as e:
-            print(f"[API_CLIENT] Error fetching virtual service {uuid}: {e}")
+            log.error("Error fetching virtual service %s: %s", uuid, e)
             return None
     
-    def get_virtual_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+    def _get_vs_index(self) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch a virtual service by name (searches in list).
-        
+        Get the name->virtual-service index, refreshing the cache if stale.
+
+        Returns:
+            Dictionary mapping virtual service names to their data
+        """
+        with self._vs_cache_lock:
+            if time.monotonic() - self._vs_cache_ts < self._vs_cache_ttl:
+                return self._vs_name_index
+
+            services = self.get_virtual_services()
+            if services is not None:
+                self._vs_name_index = {s.get('name'): s for s in services}
+                self._vs_uuid_index = {s.get('uuid'): s for s in services}
+                self._vs_cache_ts = time.monotonic()
+            return self._vs_name_index
+
+    def find_virtual_service_streaming(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a virtual service by name via streaming parse of the list
+        endpoint, short-circuiting on the first match.
+
+        Avoids materializing the full paginated response when only one
+        record is needed. Requires ijson; falls back to the cached index
+        lookup when it is not installed.
+
         Args:
             name: Name of the virtual service
-            
+
         Returns:
             Virtual service data or None if not found
         """
+        # Streaming reads require the requests backend (response.raw)
+        if ijson is None or self.http2:
+            return self._lookup_vs_by_name(name)
+
         try:
-            services = self.get_virtual_services()
-            if services:
-                for service in services:
+            url = self.urls.virtualservice
+            with self._request('get', url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    log.warning("Failed to fetch virtual services: %s", response.status_code)
+                    return None
+                # stream=True leaves the body as served; with compression
+                # negotiated on the session the raw bytes would be gzip,
+                # so have urllib3 decode as we read
+                response.raw.decode_content = True
+                body = io.BufferedReader(response.raw)
+                # Same two response shapes get_virtual_services handles:
+                # paginated {'results': [...]} or a bare array
+                head = body.peek(16).lstrip()
+                prefix = 'item' if head.startswith(b'[') else 'results.item'
+                for service in ijson.items(body, prefix):
                     if service.get('name') == name:
-                        print(f"[API_CLIENT] Found virtual service '{name}'")
+                        log.info("Found virtual service '%s' (streaming)", name)
                         return service
-            print(f"[API_CLIENT] Virtual service '{name}' not found")
+            log.info("Virtual service '%s' not found", name)
             return None
         except Exception as e:
-            print(f"[API_CLIENT] Error searching for virtual service '{name}': {e}")
+            log.error("Error searching for virtual service '%s': %s", name, e)
+            return None
+
+    def invalidate_vs_cache(self) -> None:
+        """Invalidate the cached virtual-service index."""
+        with self._vs_cache_lock:
+            self._vs_cache_ts = 0.0
+
+    def get_virtual_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a virtual service by name.
+
+        Hits the cached index (O(1)) while it is fresh; on a cold or
+        expired cache a single record is wanted from a potentially large
+        list, so the streaming lookup is used when ijson is available
+        instead of materializing the whole response.
+
+        Args:
+            name: Name of the virtual service
+
+        Returns:
+            Virtual service data or None if not found
+        """
+        with self._vs_cache_lock:
+            cache_fresh = time.monotonic() - self._vs_cache_ts < self._vs_cache_ttl
+        if not cache_fresh and ijson is not None and not self.http2:
+            return self.find_virtual_service_streaming(name)
+        return self._lookup_vs_by_name(name)
+
+    def _lookup_vs_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Resolve a virtual service through the cached name index."""
+        try:
+            service = self._get_vs_index().get(name)
+            if service is not None:
+                log.info("Found virtual service '%s'", name)
+                return service
+            log.info("Virtual service '%s' not found", name)
+            return None
+        except Exception as e:
+            log.error("Error searching for virtual service '%s': %s", name, e)
             return None
     
     def update_virtual_service(self, uuid: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -222,15 +570,17 @@ class APIClient:
             Updated virtual service data or None if request fails
         """
         try:
-            url = f"{self.base_url}/api/virtualservice/{uuid}"
-            response = self.session.put(url, json=payload, headers=self._get_headers(), timeout=self.timeout)
-            
+            url = self.urls.virtualservice + '/' + uuid
+            response = self._request('put', url, timeout=self.timeout, **self._body(payload))
+
             if response.status_code == 200:
-                print(f"[API_CLIENT] Virtual service {uuid} updated successfully")
-                return response.json()
+                log.info("Virtual service %s updated successfully", uuid)
+                self.invalidate_vs_cache()
+                return loads(response.content)
             else:
-                print(f"[API_CLIENT] Failed to update virtual service {uuid}: {response.status_code} - {response.text}")
+                log.warning("Failed to update virtual service %s: %s - %s",
+                            uuid, response.status_code, _preview(response))
                 return None
         except Exception as e:
-            print(f"[API_CLIENT] Error updating virtual service {uuid}: {e}")
+            log.error("Error updating virtual service %s: %s", uuid, e)
             return None
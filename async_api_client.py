@@ -0,0 +1,233 @@
+"""
+Async API Client module for interacting with the mock Avi Load Balancer API.
+Mirrors APIClient but uses aiohttp so many in-flight requests share one
+event loop and one connection pool instead of one thread each.
+"""
+
+import logging
+import aiohttp
+from typing import Dict, Any, Optional, List
+from _serialization import loads, dumps
+
+log = logging.getLogger(__name__)
+
+
+class AsyncAPIClient:
+    """Async client for interacting with the mock Avi Load Balancer API."""
+
+    def __init__(self, base_url: str, timeout: int = 30, connection_limit: int = 100):
+        """
+        Initialize Async API Client.
+
+        Args:
+            base_url: Base URL of the API
+            timeout: Request timeout in seconds
+            connection_limit: Maximum concurrent connections in the pool
+        """
+        self.base_url = base_url.rstrip('/')
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.connection_limit = connection_limit
+        self.token = None
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Content-Type": "application/json"}
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.session.close()
+        self.session = None
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get authorization headers with bearer token."""
+        headers = {}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    async def register(self, username: str, password: str) -> bool:
+        """
+        Register a new user on the mock API.
+
+        Args:
+            username: Username for registration
+            password: Password for registration
+
+        Returns:
+            True if registration successful, False otherwise
+        """
+        try:
+            url = f"{self.base_url}/register"
+            payload = {"username": username, "password": password}
+            async with self.session.post(url, data=dumps(payload)) as response:
+                if response.status == 200:
+                    log.info("User '%s' registered successfully", username)
+                    return True
+                elif response.status == 409:
+                    log.info("User '%s' already exists", username)
+                    return True  # Consider existing user as acceptable
+                else:
+                    log.warning("Registration failed: %s", response.status)
+                    return False
+        except Exception as e:
+            log.error("Registration error: %s", e)
+            return False
+
+    async def login(self, username: str, password: str) -> bool:
+        """
+        Login to the mock API and obtain a session token.
+
+        Args:
+            username: Username for login
+            password: Password for login
+
+        Returns:
+            True if login successful, False otherwise
+        """
+        try:
+            url = f"{self.base_url}/login"
+            auth = aiohttp.BasicAuth(username, password)
+            async with self.session.post(url, auth=auth) as response:
+                if response.status == 200:
+                    data = loads(await response.read())
+                    self.token = data.get('token')
+                    log.info("Login successful. Token: %s...", self.token[:20])
+                    return True
+                else:
+                    log.warning("Login failed: %s", response.status)
+                    return False
+        except Exception as e:
+            log.error("Login error: %s", e)
+            return False
+
+    async def get_tenants(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch all tenants from the API.
+
+        Returns:
+            List of tenants or None if request fails
+        """
+        try:
+            url = f"{self.base_url}/api/tenant"
+            async with self.session.get(url, headers=self._get_headers()) as response:
+                if response.status == 200:
+                    tenants = loads(await response.read())
+                    return tenants if isinstance(tenants, list) else [tenants]
+                log.warning("Failed to fetch tenants: %s", response.status)
+                return None
+        except Exception as e:
+            log.error("Error fetching tenants: %s", e)
+            return None
+
+    async def get_virtual_services(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch all virtual services from the API.
+
+        Returns:
+            List of virtual services or None if request fails
+        """
+        try:
+            url = f"{self.base_url}/api/virtualservice"
+            async with self.session.get(url, headers=self._get_headers()) as response:
+                if response.status == 200:
+                    data = loads(await response.read())
+                    # Handle paginated response
+                    if isinstance(data, dict) and 'results' in data:
+                        return data.get('results', [])
+                    return data if isinstance(data, list) else [data]
+                log.warning("Failed to fetch virtual services: %s", response.status)
+                return None
+        except Exception as e:
+            log.error("Error fetching virtual services: %s", e)
+            return None
+
+    async def get_service_engines(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch all service engines from the API.
+
+        Returns:
+            List of service engines or None if request fails
+        """
+        try:
+            url = f"{self.base_url}/api/serviceengine"
+            async with self.session.get(url, headers=self._get_headers()) as response:
+                if response.status == 200:
+                    engines = loads(await response.read())
+                    return engines if isinstance(engines, list) else [engines]
+                log.warning("Failed to fetch service engines: %s", response.status)
+                return None
+        except Exception as e:
+            log.error("Error fetching service engines: %s", e)
+            return None
+
+    async def get_virtual_service_by_uuid(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a virtual service by UUID.
+
+        Args:
+            uuid: UUID of the virtual service
+
+        Returns:
+            Virtual service data or None if not found
+        """
+        try:
+            url = f"{self.base_url}/api/virtualservice/{uuid}"
+            async with self.session.get(url, headers=self._get_headers()) as response:
+                if response.status == 200:
+                    return loads(await response.read())
+                log.warning("Failed to fetch virtual service %s: %s", uuid, response.status)
+                return None
+        except Exception as e:
+            log.error("Error fetching virtual service %s: %s", uuid, e)
+            return None
+
+    async def get_virtual_service_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a virtual service by name (searches in list).
+
+        Args:
+            name: Name of the virtual service
+
+        Returns:
+            Virtual service data or None if not found
+        """
+        services = await self.get_virtual_services()
+        if services:
+            for service in services:
+                if service.get('name') == name:
+                    return service
+        log.info("Virtual service '%s' not found", name)
+        return None
+
+    async def update_virtual_service(self, uuid: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Update a virtual service using PUT request.
+
+        Args:
+            uuid: UUID of the virtual service
+            payload: Update payload (e.g., {"enabled": false})
+
+        Returns:
+            Updated virtual service data or None if request fails
+        """
+        try:
+            url = f"{self.base_url}/api/virtualservice/{uuid}"
+            async with self.session.put(url, data=dumps(payload),
+                                        headers=self._get_headers()) as response:
+                if response.status == 200:
+                    log.info("Virtual service %s updated successfully", uuid)
+                    return loads(await response.read())
+                log.warning("Failed to update virtual service %s: %s", uuid, response.status)
+                return None
+        except Exception as e:
+            log.error("Error updating virtual service %s: %s", uuid, e)
+            return None
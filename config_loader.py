@@ -5,9 +5,21 @@ Handles loading test configurations, API endpoints, and credentials.
 
 import yaml
 import os
+import functools
 from typing import Dict, Any, List
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a YAML file, cached by (path, mtime) so repeated ConfigLoader
+    instantiations (e.g. one per worker) skip the re-parse while edits to
+    the file still invalidate the cache.
+    """
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
 class ConfigLoader:
     """Loads and parses YAML configuration files."""
     
@@ -28,8 +40,7 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
         
         try:
-            with open(self.config_file, 'r') as f:
-                self.config = yaml.safe_load(f)
+            self.config = _parse_yaml(self.config_file, os.path.getmtime(self.config_file))
             print(f"[CONFIG_LOADER] Configuration loaded from {self.config_file}")
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML configuration: {e}")
@@ -55,8 +66,15 @@ class ConfigLoader:
         return self.config.get('api', {}).get('timeout', 30)
     
     def get_parallelism_method(self) -> str:
-        """Get parallelism execution method (threading, multiprocessing, or asyncio)."""
-        return self.config.get('parallelism', {}).get('method', 'threading')
+        """
+        Get parallelism execution method (sequential, threading,
+        multiprocessing, or asyncio).
+
+        Defaults to 'asyncio': the workload is network-bound HTTP, which an
+        event loop handles with far less overhead than threads or processes.
+        Multiprocessing is only worthwhile for CPU-bound post-processing.
+        """
+        return self.config.get('parallelism', {}).get('method', 'asyncio')
     
     def get_max_workers(self) -> int:
         """Get maximum number of parallel workers."""
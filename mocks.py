@@ -1,8 +1,16 @@
 """
 Mock module for SSH and RDP components.
 Provides stubbed methods for SSH and RDP operations.
+
+Set MOCK_QUIET=1 to silence all mock output; stdout writes otherwise
+dominate the cost of these stubs inside tight perf-test loops.
 """
 
+import os
+
+# Bound once at import so the hot path has no per-call branch
+_log = (lambda *args, **kwargs: None) if os.environ.get("MOCK_QUIET") == "1" else print
+
 
 class MockSSH:
     """Mock SSH component for testing."""
@@ -21,8 +29,8 @@ class MockSSH:
         Returns:
             True (mock success)
         """
-        print(f"[MOCK_SSH] Connecting to host {host}:{port} with username '{username}'")
-        print(f"[MOCK_SSH] Mock connection established")
+        _log(f"[MOCK_SSH] Connecting to host {host}:{port} with username '{username}'")
+        _log(f"[MOCK_SSH] Mock connection established")
         return True
     
     @staticmethod
@@ -36,9 +44,9 @@ class MockSSH:
         Returns:
             Mock output
         """
-        print(f"[MOCK_SSH] Executing command: {command}")
+        _log(f"[MOCK_SSH] Executing command: {command}")
         mock_output = f"Mock output for command: {command}"
-        print(f"[MOCK_SSH] Command executed successfully")
+        _log(f"[MOCK_SSH] Command executed successfully")
         return mock_output
     
     @staticmethod
@@ -49,7 +57,7 @@ class MockSSH:
         Returns:
             True (mock success)
         """
-        print(f"[MOCK_SSH] Disconnecting from host")
+        _log(f"[MOCK_SSH] Disconnecting from host")
         return True
 
 
@@ -70,9 +78,9 @@ class MockRDP:
         Returns:
             True (mock success)
         """
-        print(f"[MOCK_RDP] Validating remote connection to {host}:{port}")
-        print(f"[MOCK_RDP] Authenticating user '{username}'")
-        print(f"[MOCK_RDP] Remote connection established")
+        _log(f"[MOCK_RDP] Validating remote connection to {host}:{port}")
+        _log(f"[MOCK_RDP] Authenticating user '{username}'")
+        _log(f"[MOCK_RDP] Remote connection established")
         return True
     
     @staticmethod
@@ -87,10 +95,10 @@ class MockRDP:
         Returns:
             True (mock success)
         """
-        print(f"[MOCK_RDP] Executing remote action: {action}")
+        _log(f"[MOCK_RDP] Executing remote action: {action}")
         if parameters:
-            print(f"[MOCK_RDP] Action parameters: {parameters}")
-        print(f"[MOCK_RDP] Remote action completed successfully")
+            _log(f"[MOCK_RDP] Action parameters: {parameters}")
+        _log(f"[MOCK_RDP] Remote action completed successfully")
         return True
     
     @staticmethod
@@ -101,5 +109,5 @@ class MockRDP:
         Returns:
             True (mock success)
         """
-        print(f"[MOCK_RDP] Closing remote connection")
+        _log(f"[MOCK_RDP] Closing remote connection")
         return True